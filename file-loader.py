@@ -1,9 +1,9 @@
 #! /usr/bin/env python3
 
 import argparse
+import collections
 import concurrent.futures
 import importlib
-import itertools
 import logging
 import os
 import pathlib
@@ -29,9 +29,9 @@ except ModuleNotFoundError:
     import json
 
 __all__ = []
-__version__ = "1.3.5"  # See https://www.python.org/dev/peps/pep-0396/
+__version__ = "1.4.0"  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = "2022-11-29"
-__updated__ = "2025-06-03"
+__updated__ = "2026-10-19"
 
 
 # Custom actions for argparse. Enables checking if an arg "was specified" on the CLI to check if CLI args should take
@@ -158,16 +158,6 @@ def get_redo_record(engine):
     return redo_record.decode()
 
 
-def prime_redo_records(engine, quantity):
-    """Get a specified number of redo records for priming processing"""
-    redo_records = []
-    for _ in range(quantity):
-        single_redo_rec = get_redo_record(engine)
-        if single_redo_rec:
-            redo_records.append(single_redo_rec)
-    return redo_records
-
-
 def process_redo_record(engine, record, with_info):
     """Process a single redo record, returning with info details if --info or SENZING_WITHINFO was specified"""
     if with_info:
@@ -221,6 +211,125 @@ def long_running_check(futures, time_now, num_workers):
         logger.warning(f"All {num_workers} threads are stuck processing long running records")
 
 
+class DispatchLane:
+    """Concurrency budget, waiting records and statistics for records within a payload size range"""
+
+    def __init__(self, name, max_size, budget):
+        self.name = name
+        self.max_size = max_size
+        self.budget = budget
+        self.backlog = collections.deque()
+        self.in_flight = 0
+        self.success_recs = 0
+        self.error_recs = 0
+        self.borrowed = 0
+        self.total_secs = 0.0
+        self.max_secs = 0.0
+
+
+class LaneDispatcher:
+    """Sort records read from the input file into lanes by payload size so a burst of large records can't take
+    every worker. Held back records are kept as file offsets and read again when dispatched"""
+
+    def __init__(self, in_file, max_workers, large_size, large_threads):
+        self.in_file = in_file
+        self.offset = in_file.tell()
+
+        # A large record size of 0 disables lanes, all records share the full pool
+        if large_size > 0:
+            self.lanes = [
+                DispatchLane(f"small (< {large_size:,} bytes)", large_size - 1, max_workers),
+                DispatchLane(f"large (>= {large_size:,} bytes)", None, max(1, min(large_threads, max_workers))),
+            ]
+        else:
+            self.lanes = [DispatchLane("all", None, max_workers)]
+
+    def lane_for(self, record):
+        """Return the lane a record belongs in based on its size"""
+        for lane in self.lanes:
+            if lane.max_size is None or len(record) <= lane.max_size:
+                return lane
+
+    def read_at(self, offset):
+        """Read a held back record and return to the current position in the file"""
+        self.in_file.seek(offset)
+        record = self.in_file.readline()
+        self.in_file.seek(self.offset)
+        return record
+
+    def take(self, lane, record, borrowed=False):
+        """Mark a record as dispatched on a lane"""
+        lane.in_flight += 1
+        if borrowed:
+            lane.borrowed += 1
+        return record.decode(), lane
+
+    def next_record(self):
+        """Get the next record to submit and its lane, returns (None, None) when there is no more work"""
+        # Held back records in a lane with spare budget go first to preserve file order as much as possible
+        for lane in self.lanes:
+            if lane.backlog and lane.in_flight < lane.budget:
+                return self.take(lane, self.read_at(lane.backlog.popleft()))
+
+        # Read ahead for a record in a lane with spare budget, holding back records for lanes that are full
+        while not do_shutdown and (record := self.in_file.readline()):
+            offset = self.offset
+            self.offset += len(record)
+            lane = self.lane_for(record)
+            if lane.in_flight < lane.budget:
+                return self.take(lane, record)
+            lane.backlog.append(offset)
+            if len(lane.backlog) >= LANE_HOLD_BACK_LIMIT:
+                break
+
+        if do_shutdown:
+            return None, None
+
+        # End of the file or too many held back records, idle workers take held back records regardless of budgets
+        for lane in self.lanes:
+            if lane.backlog:
+                return self.take(lane, self.read_at(lane.backlog.popleft()), borrowed=True)
+
+        return None, None
+
+    def completed(self, lane, duration, error):
+        """Release a lane slot and record statistics for a finished record"""
+        lane.in_flight -= 1
+        lane.total_secs += duration
+        lane.max_secs = max(lane.max_secs, duration)
+        if error:
+            lane.error_recs += 1
+        else:
+            lane.success_recs += 1
+
+    def log_held_back(self):
+        """Log records that were read from the file and held back but not loaded due to shutting down"""
+        held_back = [offset for lane in self.lanes for offset in lane.backlog]
+        if not held_back:
+            return
+
+        logger.error(
+            f"{len(held_back):,} held back record(s) were not loaded, between byte offsets"
+            f" {min(held_back):,} and {max(held_back):,} of the input file"
+        )
+
+    def log_stats(self):
+        """Log per lane statistics for the results summary"""
+        logger.info("Load Lanes")
+        logger.info("----------")
+        for lane in self.lanes:
+            num_recs = lane.success_recs + lane.error_recs
+            avg_secs = lane.total_secs / num_recs if num_recs else 0
+            logger.info("")
+            logger.info(f"Lane:                         {lane.name}")
+            logger.info(f"Threads:                      {lane.budget}")
+            logger.info(f"Successful records:           {lane.success_recs:,}")
+            logger.info(f"Error records:                {lane.error_recs:,}")
+            logger.info(f"Borrowed idle threads:        {lane.borrowed:,}")
+            logger.info(f"Average record time (secs):   {avg_secs:.3f}")
+            logger.info(f"Max record time (secs):       {lane.max_secs:.3f}")
+
+
 def signal_int(signum, frame):
     """Interrupt to allow running threads to finish"""
     logger.warning("Please wait for running tasks to complete, this could take many minutes...\n")
@@ -237,15 +346,18 @@ def load_and_redo(
     with_info,
     call_governor,
     gov,
+    large_rec_size,
+    large_rec_threads,
 ):
     """Load records and process redo records after loading is complete"""
 
     def add_new_future():
         """Add a new feature as needed"""
+        # Redo records are small and are removed from the redo queue when fetched, they aren't held back in lanes
         if mode.__name__ == "add_record":
-            record = in_file.readline()
+            record, lane = dispatcher.next_record()
         else:
-            record = get_redo_record(engine)
+            record, lane = get_redo_record(engine), None
         if record:
             futures[
                 executor.submit(
@@ -254,7 +366,7 @@ def load_and_redo(
                     record,
                     with_info,
                 )
-            ] = (record, time.time())
+            ] = (record, time.time(), lane)
             return False
         return True
 
@@ -281,9 +393,13 @@ def load_and_redo(
     with concurrent.futures.ThreadPoolExecutor() as test:
         test_workers = test._max_workers
     max_workers = num_workers if num_workers else test_workers
+    # Default the large record lane to a quarter of the workers
+    large_rec_threads = large_rec_threads if large_rec_threads else max(1, max_workers // 4)
+    dispatcher = None
 
+    # Binary mode to track byte offsets of records held back by the lane dispatcher
     if ingest_file:
-        in_file = open(file_input, "r")
+        in_file = open(file_input, "rb")
 
     overall_start_time = time.time()
 
@@ -304,21 +420,12 @@ def load_and_redo(
             with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
 
                 if mode.__name__ == "add_record":
-                    futures = {
-                        executor.submit(mode, engine, record, with_info): (
-                            record,
-                            time.time(),
-                        )
-                        for record in itertools.islice(in_file, executor._max_workers)
-                    }
-                else:
-                    futures = {
-                        executor.submit(mode, engine, record, with_info): (
-                            record,
-                            time.time(),
-                        )
-                        for record in prime_redo_records(engine, executor._max_workers)
-                    }
+                    dispatcher = LaneDispatcher(in_file, executor._max_workers, large_rec_size, large_rec_threads)
+
+                futures = {}
+                while len(futures) < executor._max_workers and not end_of_recs:
+                    end_of_recs = add_new_future()
+
                 logger.info("")
                 logger.info(f"{mode_text[mode.__name__]['start_msg']} {executor._max_workers} threads...")
                 logger.info("")
@@ -326,6 +433,7 @@ def load_and_redo(
                 while futures:
                     done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
                     for f in done:
+                        rec_error = False
                         try:
                             result = f.result()
                         except (
@@ -339,6 +447,7 @@ def load_and_redo(
                                 f" Record: {futures[f][PAYLOAD_RECORD]}"
                             )
                             error_recs += 1
+                            rec_error = True
                         except G2Exception as ex:
                             logger.critical(
                                 f"Exception: {ex} - Operation:"
@@ -346,6 +455,7 @@ def load_and_redo(
                                 f" Record: {futures[f][PAYLOAD_RECORD]}"
                             )
                             error_recs += 1
+                            rec_error = True
                             do_shutdown = True
                         else:
                             if result:
@@ -360,6 +470,11 @@ def load_and_redo(
                                     mode_text[mode.__name__]["stats_msg"],
                                 )
                         finally:
+                            # Release the lane slot first so the replacement record can use it
+                            if futures[f][PAYLOAD_LANE]:
+                                dispatcher.completed(
+                                    futures[f][PAYLOAD_LANE], time.time() - futures[f][PAYLOAD_START_TIME], rec_error
+                                )
                             if add_future and not do_shutdown:
                                 end_of_recs = add_new_future()
 
@@ -386,7 +501,7 @@ def load_and_redo(
                         # If processing was halted futures would be drained, once processing can continue create
                         # new futures
                         if add_future and not end_of_recs:
-                            while len(futures) < executor._max_workers:
+                            while len(futures) < executor._max_workers and not end_of_recs:
                                 end_of_recs = add_new_future()
 
                     time_now = time.time()
@@ -402,6 +517,8 @@ def load_and_redo(
 
             if do_shutdown:
                 logger.warning("Processing was interrupted, shutting down.")
+                if mode.__name__ == "add_record":
+                    dispatcher.log_held_back()
                 sys.exit(-1)
 
             # Store loading stats for overall results stats
@@ -438,6 +555,9 @@ def load_and_redo(
         logger.info(f"Error redo records:           {error_recs:,}")
         logger.info(f"Redo elapsed time (mins):     {redo_time}")
         logger.info("")
+        if dispatcher and large_rec_size:
+            dispatcher.log_stats()
+            logger.info("")
         logger.info(f"Total elapsed time (mins):    {total_time}")
 
         if not cli_args.info and not os.getenv("SENZING_WITHINFO"):
@@ -457,6 +577,8 @@ if __name__ == "__main__":
     MODULE_NAME = pathlib.Path(sys.argv[0]).stem
     PAYLOAD_RECORD = 0
     PAYLOAD_START_TIME = 1
+    PAYLOAD_LANE = 2
+    LANE_HOLD_BACK_LIMIT = 1000
     WORK_STATS_INTERVAL = 60
     do_shutdown = False
     gov = None
@@ -566,6 +688,46 @@ if __name__ == "__main__":
              """
         ),
     )
+    arg_parser.add_argument(
+        "-lrs",
+        "--largeRecordSize",
+        action=CustomArgAction,
+        default=0,
+        metavar="size",
+        type=int,
+        help=textwrap.dedent(
+            """\
+               Records of this size in bytes or larger are dispatched in a separate
+               lane with a limited number of threads, so a burst of large records
+               doesn't block smaller records. Large records can be loaded after
+               records later in the file, if the file has more than one version of
+               the same record an older version could be loaded last.
+
+               Default: 0, lanes are disabled.
+               Env Var: SENZING_LARGE_RECORD_SIZE
+
+             """
+        ),
+    )
+    arg_parser.add_argument(
+        "-lrt",
+        "--largeRecordThreads",
+        action=CustomArgAction,
+        default=0,
+        metavar="num_threads",
+        type=int,
+        help=textwrap.dedent(
+            """\
+               Number of worker threads that can process large records at the same
+               time. Once the end of the file is reached, or too many large records
+               are held back, idle threads also process held back large records.
+
+               Default: A quarter of the total number of worker threads.
+               Env Var: SENZING_LARGE_RECORD_THREADS
+
+             """
+        ),
+    )
     cli_args = arg_parser.parse_args()
 
     # If a CLI arg was specified use it, else try the env var, if no env var use the default for the CLI arg
@@ -592,6 +754,16 @@ if __name__ == "__main__":
         if cli_args.__dict__.get("numThreads_specified")
         else int(os.getenv("SENZING_THREADS_PER_PROCESS", cli_args.numThreads))
     )
+    large_record_size = (
+        cli_args.largeRecordSize
+        if cli_args.__dict__.get("largeRecordSize_specified")
+        else int(os.getenv("SENZING_LARGE_RECORD_SIZE", cli_args.largeRecordSize))
+    )
+    large_record_threads = (
+        cli_args.largeRecordThreads
+        if cli_args.__dict__.get("largeRecordThreads_specified")
+        else int(os.getenv("SENZING_LARGE_RECORD_THREADS", cli_args.largeRecordThreads))
+    )
 
     errors_file = f'{MODULE_NAME}_errors_{str(datetime.now().strftime("%Y%m%d_%H%M%S"))}.log'
     withinfo_file = f'{MODULE_NAME}_withInfo_{str(datetime.now().strftime("%Y%m%d_%H%M%S"))}.jsonl'
@@ -627,6 +799,13 @@ if __name__ == "__main__":
         )
         sys.exit(-1)
 
+    if large_record_size < 0 or large_record_threads < 0:
+        logger.warning(
+            "SENZING_LARGE_RECORD_SIZE / --largeRecordSize and SENZING_LARGE_RECORD_THREADS / --largeRecordThreads"
+            " must be 0 or greater"
+        )
+        sys.exit(-1)
+
     try:
         sz_engine = G2Engine()
         sz_engine.init("G2Engine", engine_config, debug_trace)
@@ -677,6 +856,8 @@ if __name__ == "__main__":
         withinfo,
         db_is_postgres,
         gov,
+        large_record_size,
+        large_record_threads,
     )
 
     try: